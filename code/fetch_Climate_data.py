@@ -36,8 +36,30 @@ Last Modified: [2/19/2026]
 
 import pandas as pd
 import numpy as np
+from datetime import datetime
 from pathlib import Path
 import logging
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Import centralized path configuration
 from config_paths import RAW_DATA_DIR, PROCESSED_DATA_DIR
@@ -56,6 +78,17 @@ logger = logging.getLogger(__name__)
 # Input/Output file names
 RAW_FILENAME = "climate_stocks_raw.csv"  # Raw climate and stocks data
 PROCESSED_FILENAME = "climate_stocks_clean.csv"  # Output for data/processed/
+PROCESSED_PARQUET = "climate_stocks_clean.parquet"  # Columnar output (needs pyarrow)
+SAVE_CSV = True  # Also write the CSV for back-compat with existing readers
+USE_POLARS = os.getenv('USE_POLARS') == '1'  # Opt-in Polars backend for load + filters
+STREAM_RAW = os.getenv('STREAM_RAW') == '1'  # Opt-in batched read for very large raw files
+USE_NUMBA = os.getenv('USE_NUMBA') == '1'  # Opt-in JIT z-score kernel (compile cost beats NumPy only on huge blocks)
+STREAM_BLOCK_SIZE = 64 << 20  # Bytes of CSV parsed per record batch when streaming
+
+if USE_POLARS and not HAS_POLARS:
+    logger.warning("USE_POLARS=1 but polars is not installed; using pandas")
+if USE_NUMBA and not HAS_NUMBA:
+    logger.warning("USE_NUMBA=1 but numba is not installed; using NumPy")
 
 # Data quality thresholds
 MIN_OBSERVATIONS = 20  # Minimum company-date observations
@@ -70,14 +103,27 @@ END_DATE = "2024-12-31"  # Analysis period end
 
 # Key columns for validation
 REQUIRED_COLUMNS = ['date', 'ticker', 'stock_price', 'climate_score', 'returns']
+PANEL_KEY = ['ticker', 'date']  # One observation per company per date
+CATEGORICAL_COLUMNS = ['ticker', 'rtype']  # Low-cardinality labels stored as category
 
 
 # ============================================================================
 # Section 3: Load Raw Data
 # ============================================================================
 
-def load_raw_data(filename=RAW_FILENAME):
-    """Load raw CSV data with type inference."""
+def load_raw_data(filename=RAW_FILENAME, stream=STREAM_RAW):
+    """
+    Load raw CSV data with type inference.
+
+    Uses pyarrow's multithreaded CSV parser when available and falls back
+    to pd.read_csv otherwise (or Polars' reader with USE_POLARS=1).
+    Either way the result is a numpy-backed pandas frame.
+
+    With stream=True (STREAM_RAW=1) the file is read in record batches
+    that are trimmed to the analysis window as they arrive, so peak
+    memory is one block plus the kept rows. Imputation and z-scores are
+    then computed over in-window rows only, which is why it is opt-in.
+    """
     raw_path = RAW_DATA_DIR / filename
     
     if not raw_path.exists():
@@ -86,21 +132,83 @@ def load_raw_data(filename=RAW_FILENAME):
     
     logger.info(f"Loading raw data from: {raw_path}")
     
-    df = pd.read_csv(raw_path)
+    if stream and not HAS_PYARROW:
+        logger.warning("Streaming read needs pyarrow; loading the whole file")
+    
+    if HAS_PYARROW:
+        convert_options = pa_csv.ConvertOptions(
+            column_types={
+                'date': pa.timestamp('ns'),
+                'ticker': pa.dictionary(pa.int32(), pa.string()),
+            },
+            strings_can_be_null=True,
+        )
+    
+    if stream and HAS_PYARROW:
+        df = read_raw_batches(raw_path, convert_options)
+    elif USE_POLARS and HAS_POLARS:
+        df = pl.read_csv(raw_path, try_parse_dates=True).to_pandas()
+    elif HAS_PYARROW:
+        table = pa_csv.read_csv(
+            raw_path,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=convert_options,
+        )
+        df = table.to_pandas()
+    else:
+        df = pd.read_csv(raw_path, dtype={'ticker': 'category'})
+    
+    # Repeated labels as category: one small int code per row, int-keyed groupbys
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
     
     logger.info(f"Loaded {len(df):,} rows × {len(df.columns)} columns")
-    logger.info(f"Data types:\n{df.dtypes}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Data types:\n{df.dtypes}")
     
     return df
 
 
+def read_raw_batches(raw_path, convert_options, block_size=STREAM_BLOCK_SIZE):
+    """
+    Stream a CSV with pyarrow.csv.open_csv and keep in-window rows only.
+    
+    Only the START_DATE-END_DATE window is applied per batch (rows with a
+    missing date are kept for imputation). The value filters depend on
+    imputed values and the MIN_OBSERVATIONS count spans batches, so both
+    stay in apply_filters.
+    """
+    reader = pa_csv.open_csv(
+        raw_path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        convert_options=convert_options,
+    )
+    start, end = pd.Timestamp(START_DATE), pd.Timestamp(END_DATE)
+    
+    parts = []
+    for batch in reader:
+        part = batch.to_pandas()
+        if 'date' in part.columns:
+            in_window = part['date'].isna() | part['date'].between(start, end)
+            part = part.loc[in_window]
+        parts.append(part)
+    
+    if not parts:
+        return reader.schema.empty_table().to_pandas()
+    return pd.concat(parts, ignore_index=True)
+
+
 # ============================================================================
 # Section 4: Clean Missing Values
 # ============================================================================
 
-def clean_missing_values(df, threshold=MISSING_THRESHOLD):
+def clean_missing_values(df, threshold=MISSING_THRESHOLD, numeric_cols=None):
     """
     Handle missing values with logging of strategy.
+    
+    numeric_cols can be passed in from main() so the dtype scan is done
+    once per pipeline; it is resolved from df when omitted.
     """
     logger.info("=" * 50)
     logger.info("CLEANING MISSING VALUES")
@@ -109,8 +217,11 @@ def clean_missing_values(df, threshold=MISSING_THRESHOLD):
     rows_before = len(df)
     cols_before = len(df.columns)
     
+    # Count nulls once; the percentages, drop list and fill list all reuse it
+    null_counts = df.isnull().sum()
+    
     # Identify columns with excessive missing values
-    missing_pct = (df.isnull().sum() / len(df) * 100).sort_values(ascending=False)
+    missing_pct = (null_counts / len(df) * 100).sort_values(ascending=False)
     
     if len(missing_pct[missing_pct > 0]) > 0:
         logger.info(f"\nMissing value percentages (>0%):")
@@ -125,22 +236,35 @@ def clean_missing_values(df, threshold=MISSING_THRESHOLD):
             logger.info(f"  - {col}")
         df = df.drop(columns=cols_to_drop)
     
-    # Impute remaining missing values
+    # Impute remaining missing values with one fill map and a single fillna
     logger.info("\nImputing remaining missing values:")
-    for col in df.columns:
-        if df[col].isnull().sum() > 0:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                fill_value = df[col].median()
-                df[col].fillna(fill_value, inplace=True)
-                logger.info(f"  {col}: imputed with median ({fill_value:.2f})")
-            elif pd.api.types.is_datetime64_any_dtype(df[col]):
-                fill_value = df[col].mode()[0] if not df[col].mode().empty else df[col].max()
-                df[col].fillna(fill_value, inplace=True)
-                logger.info(f"  {col}: imputed with date mode")
-            else:
-                fill_value = df[col].mode()[0] if not df[col].mode().empty else "Unknown"
-                df[col].fillna(fill_value, inplace=True)
-                logger.info(f"  {col}: imputed with mode ({fill_value})")
+    null_counts = null_counts.drop(cols_to_drop)
+    cols_needing_fill = null_counts[null_counts > 0].index
+    if numeric_cols is None:
+        numeric_cols = df.columns[df.dtypes.map(pd.api.types.is_numeric_dtype)]
+    numeric_fill = pd.Index(numeric_cols).intersection(cols_needing_fill)
+    medians = np.nanmedian(df[numeric_fill].to_numpy(dtype=np.float64), axis=0)
+    fill_map = dict(zip(numeric_fill, medians))
+    other_fill = cols_needing_fill.drop(numeric_fill)
+    datetime_fill = df[other_fill].select_dtypes(include=['datetime', 'datetimetz']).columns
+    for col in other_fill:
+        mode_result = df[col].mode()
+        if not mode_result.empty:
+            fill_map[col] = mode_result.iat[0]
+        elif col in datetime_fill:
+            fill_map[col] = df[col].max()
+        else:
+            fill_map[col] = "Unknown"
+    df = df.fillna(fill_map)
+    
+    for col in cols_needing_fill:
+        fill_value = fill_map[col]
+        if col in numeric_fill:
+            logger.info(f"  {col}: imputed with median ({fill_value:.2f})")
+        elif col in datetime_fill:
+            logger.info(f"  {col}: imputed with date mode")
+        else:
+            logger.info(f"  {col}: imputed with mode ({fill_value})")
     
     logger.info(f"\nResult: {len(df):,} rows × {len(df.columns)} columns")
     logger.info(f"  (removed {cols_before - len(df.columns)} columns)")
@@ -152,7 +276,75 @@ def clean_missing_values(df, threshold=MISSING_THRESHOLD):
 # Section 5: Handle Outliers (Alternative: Z-score method)
 # ============================================================================
 
-def handle_outliers_zscore(df, threshold=3.0):
+if USE_NUMBA and HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def zscore_outlier_mask(values, threshold):
+        """
+        Fused z-score kernel over a 2D float64 block (rows × columns).
+        
+        Columns (in parallel) get their NaN-aware mean and ddof=1 std and
+        their outlier counts; rows (in parallel) are then flagged if any
+        |z| > threshold, so no intermediate z matrix is allocated and each
+        iteration writes only its own output slot.
+        
+        Returns:
+            (bool array: row has any outlier, int array: outliers per column)
+        """
+        n_rows, n_cols = values.shape
+        means = np.zeros(n_cols)
+        stds = np.full(n_cols, np.nan)  # NaN std: the column never flags
+        col_counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            total = 0.0
+            n = 0
+            for i in range(n_rows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    total += v
+                    n += 1
+            if n < 2:
+                continue
+            mean = total / n
+            sq_dev = 0.0
+            for i in range(n_rows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    sq_dev += (v - mean) ** 2
+            std = np.sqrt(sq_dev / (n - 1))
+            if std == 0.0:
+                continue
+            means[j] = mean
+            stds[j] = std
+            count = 0
+            for i in range(n_rows):
+                if abs(values[i, j] - mean) / std > threshold:  # False for NaN
+                    count += 1
+            col_counts[j] = count
+        
+        outlier_rows = np.zeros(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                if abs(values[i, j] - means[j]) / stds[j] > threshold:
+                    outlier_rows[i] = True
+                    break
+        return outlier_rows, col_counts
+else:
+    def zscore_outlier_mask(values, threshold):
+        """
+        NumPy z-score mask over a 2D float64 block (rows × columns).
+        
+        Returns:
+            (bool array: row has any outlier, int array: outliers per column)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.abs(
+                (values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0, ddof=1)
+            )
+        outlier_mask = z_scores > threshold  # NaN scores compare False and are kept
+        return outlier_mask.any(axis=1), outlier_mask.sum(axis=0)
+
+
+def handle_outliers_zscore(df, threshold=3.0, numeric_cols=None):
     """
     Handle outliers using Z-score method.
     
@@ -160,27 +352,32 @@ def handle_outliers_zscore(df, threshold=3.0):
       - More suitable for normally distributed data
       - Removes extreme outliers (>3σ ≈ 0.3%)
       - Alternative to Winsorization when data is normally distributed
+    
+    numeric_cols is resolved from df when not passed in from main().
     """
     logger.info("=" * 50)
     logger.info("HANDLING OUTLIERS (Z-score method)")
     logger.info("=" * 50)
     
-    outliers_count = 0
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if numeric_cols is None:
+        numeric_cols = df.columns[df.dtypes.map(pd.api.types.is_numeric_dtype)]
     
-    for col in numeric_cols:
-        # Calculate z-scores
-        z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-        outlier_mask = z_scores > threshold
-        col_outliers = outlier_mask.sum()
-        
+    # Score all numeric columns in one pass over the same row set
+    # (z is computed on the unfiltered data for every column); the block is
+    # column-major so each column is a contiguous scan
+    values = np.asfortranarray(df[numeric_cols].to_numpy(dtype=np.float64))
+    outlier_rows, col_counts = zscore_outlier_mask(values, float(threshold))
+    
+    for col, col_outliers in zip(numeric_cols, col_counts):
         if col_outliers > 0:
-            # Remove rows with extreme outliers
-            df = df[~outlier_mask]
-            outliers_count += col_outliers
-            logger.info(f"  {col}: removed {col_outliers} outliers (|z| > {threshold})")
+            logger.info(f"  {col}: {col_outliers} outliers (|z| > {threshold})")
     
-    if outliers_count == 0:
+    # Remove rows with an extreme value in any column
+    outliers_count = int(outlier_rows.sum())
+    if outliers_count > 0:
+        df = df.loc[~outlier_rows]
+        logger.info(f"  Removed {outliers_count} rows with extreme outliers")
+    else:
         logger.info("  No extreme outliers detected")
     
     logger.info(f"Result: {len(df):,} rows remaining")
@@ -193,16 +390,24 @@ def handle_outliers_zscore(df, threshold=3.0):
 # ============================================================================
 
 def remove_duplicates(df):
-    """Remove exact duplicate rows."""
+    """
+    Remove duplicate company-date observations.
+    
+    Rows are matched on PANEL_KEY (ticker, date) when both columns exist,
+    so only the two key columns are hashed; otherwise on the full row.
+    """
     logger.info("=" * 50)
     logger.info("REMOVING DUPLICATES")
     logger.info("=" * 50)
     
-    dup_count = df.duplicated().sum()
+    subset = PANEL_KEY if set(PANEL_KEY).issubset(df.columns) else None
+    
+    rows_before = len(df)
+    df = df.drop_duplicates(subset=subset, keep='first', ignore_index=True)
+    dup_count = rows_before - len(df)
     
     if dup_count > 0:
         logger.info(f"  Found {dup_count} duplicate rows")
-        df = df.drop_duplicates(keep='first')
         logger.info(f"  ✓ Duplicates removed")
     else:
         logger.info("  No duplicates found")
@@ -227,68 +432,135 @@ def apply_filters(df):
       4. Paired data: Keep only rows with both stock price and climate data
       5. Returns validity: Ensure returns are computable
       6. Company observations: Keep only companies with MIN_OBSERVATIONS periods
+    
+    With USE_POLARS=1 the same filters run as one lazy Polars plan.
     """
+    if USE_POLARS and HAS_POLARS:
+        return apply_filters_polars(df)
+    
     logger.info("=" * 50)
     logger.info("APPLYING CLIMATE & STOCKS FILTERS")
     logger.info("=" * 50)
     
     rows_before = len(df)
     
+    # Column membership and the required-column list are resolved once per call
+    cols = frozenset(df.columns)
+    required_cols = [col for col in REQUIRED_COLUMNS if col in cols]
+    
+    # Each filter ANDs into one boolean mask; the frame is sliced once at the end
+    keep = np.ones(rows_before, dtype=bool)
+    
     # FILTER 1: Date range
-    if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'])
-        df = df[(df['date'] >= START_DATE) & (df['date'] <= END_DATE)]
+    if 'date' in cols:
+        df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, cache=True)
+        keep &= df['date'].between(START_DATE, END_DATE).to_numpy()
         logger.info(f"  Filter 1: Date range {START_DATE} to {END_DATE}")
     
     # FILTER 2: Stock price threshold (remove penny stocks)
-    if 'stock_price' in df.columns:
-        price_before = len(df)
-        df = df[df['stock_price'] >= MIN_STOCK_PRICE]
-        price_removed = price_before - len(df)
+    if 'stock_price' in cols:
+        price_before = keep.sum()
+        keep &= (df['stock_price'] >= MIN_STOCK_PRICE).to_numpy()
+        price_removed = price_before - keep.sum()
         logger.info(f"  Filter 2: Stock price >= ${MIN_STOCK_PRICE} (removed {price_removed} rows)")
     
     # FILTER 3: Climate score validity
-    if 'climate_score' in df.columns:
-        climate_before = len(df)
-        df = df[df['climate_score'].notna()]
-        climate_removed = climate_before - len(df)
+    if 'climate_score' in cols:
+        climate_before = keep.sum()
+        keep &= df['climate_score'].notna().to_numpy()
+        climate_removed = climate_before - keep.sum()
         logger.info(f"  Filter 3: Valid climate scores (removed {climate_removed} rows)")
     
     # FILTER 4: Paired data requirement
-    # Only keep rows where we have both stock and climate data
-    required_cols = [col for col in REQUIRED_COLUMNS if col in df.columns]
-    paired_before = len(df)
-    df = df[df[required_cols].notna().all(axis=1)]
-    paired_removed = paired_before - len(df)
+    # Only keep rows where we have both stock and climate data. ANDed one column
+    # at a time into keep, so no rows × columns boolean block is allocated
+    paired_before = keep.sum()
+    for col in required_cols:
+        np.logical_and(keep, df[col].notna().to_numpy(), out=keep)
+        if not keep.any():
+            break
+    paired_removed = paired_before - keep.sum()
     logger.info(f"  Filter 4: Paired observations (removed {paired_removed} rows)")
     
     # FILTER 5: Returns validity
-    if 'returns' in df.columns:
-        returns_before = len(df)
+    if 'returns' in cols:
+        returns_before = keep.sum()
         # Keep only valid numeric returns (not NaN or infinite)
-        df = df[(df['returns'].notna()) & (np.isfinite(df['returns']))]
-        returns_removed = returns_before - len(df)
+        keep &= np.isfinite(df['returns'].to_numpy(dtype=np.float64))
+        returns_removed = returns_before - keep.sum()
         logger.info(f"  Filter 5: Valid returns (removed {returns_removed} rows)")
     
-    # FILTER 6: Minimum company observations
-    if 'ticker' in df.columns:
-        company_counts = df['ticker'].value_counts()
-        small_companies = company_counts[company_counts < MIN_OBSERVATIONS].index
-        if len(small_companies) > 0:
-            df = df[~df['ticker'].isin(small_companies)]
-            logger.info(f"  Filter 6: Companies with >={MIN_OBSERVATIONS} obs (removed {len(small_companies)} companies)")
+    # FILTER 6: Minimum company observations (counted over rows kept so far)
+    if 'ticker' in cols:
+        # Per-row company size from one hash groupby (int-keyed for categoricals)
+        tickers = df.loc[keep, 'ticker']
+        company_obs = tickers.groupby(tickers, sort=False, observed=True).transform('size')
+        small_rows = (company_obs < MIN_OBSERVATIONS).to_numpy()
+        if small_rows.any():
+            keep[keep] = ~small_rows
+            n_small = tickers[small_rows].nunique()
+            logger.info(f"  Filter 6: Companies with >={MIN_OBSERVATIONS} obs (removed {n_small} companies)")
+    
+    df = df.loc[keep]
     
     rows_removed = rows_before - len(df)
     if rows_removed > 0:
         pct_removed = (rows_removed / rows_before * 100)
         logger.info(f"  ✓ Total: {rows_removed} rows removed ({pct_removed:.1f}%)")
     
+    logger.info(f"Result: {len(df):,} rows")
+    
     return df
 
-    return df
 
+def apply_filters_polars(df):
+    """
+    Polars version of apply_filters.
+    
+    Filters 1-5 become one predicate on a LazyFrame and filter 6 a window
+    count over ticker, so the plan is optimized and collected (streaming
+    engine) once. The result is handed back to pandas for the later steps.
+    """
+    logger.info("=" * 50)
+    logger.info("APPLYING CLIMATE & STOCKS FILTERS (Polars)")
+    logger.info("=" * 50)
+    
+    rows_before = len(df)
+    
+    cols = frozenset(df.columns)
+    required_cols = [col for col in REQUIRED_COLUMNS if col in cols]
+    
+    if 'date' in cols:
+        df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, cache=True)
+    
+    conditions = []
+    if 'date' in cols:
+        conditions.append(pl.col('date').is_between(
+            datetime.strptime(START_DATE, DATE_FORMAT),
+            datetime.strptime(END_DATE, DATE_FORMAT),
+        ))
+    if 'stock_price' in cols:
+        conditions.append(pl.col('stock_price') >= MIN_STOCK_PRICE)
+    if 'climate_score' in cols:
+        conditions.append(pl.col('climate_score').is_not_null())
+    if required_cols:
+        conditions.append(pl.all_horizontal(pl.col(required_cols).is_not_null()))
+    if 'returns' in cols:
+        conditions.append(pl.col('returns').is_finite())
+    
+    lf = pl.from_pandas(df).lazy()
+    if conditions:
+        lf = lf.filter(pl.all_horizontal(conditions))
+    if 'ticker' in cols:
+        lf = lf.filter(pl.len().over('ticker') >= MIN_OBSERVATIONS)
+    
+    df = lf.collect(engine='streaming').to_pandas()
+    logger.info("  Filters 1-6 applied as one lazy Polars plan")
+    
+    rows_removed = rows_before - len(df)
     if rows_removed > 0:
-        logger.info(f"  Total rows removed: {rows_removed} ({rows_removed/rows_before*100:.1f}%)")
+        pct_removed = (rows_removed / rows_before * 100)
+        logger.info(f"  ✓ Total: {rows_removed} rows removed ({pct_removed:.1f}%)")
     
     logger.info(f"Result: {len(df):,} rows")
     
@@ -331,24 +603,39 @@ def validate_cleaned_data(df):
 # Section 9: Save Cleaned Data
 # ============================================================================
 
-def save_cleaned_data(df, filename=PROCESSED_FILENAME):
-    """Save cleaned dataframe."""
-    output_path = PROCESSED_DATA_DIR / filename
-    
+def save_cleaned_data(df, filename=PROCESSED_FILENAME, parquet_filename=PROCESSED_PARQUET):
+    """
+    Save cleaned dataframe.
+
+    Writes zstd-compressed Parquet when pyarrow is available. The CSV copy
+    is kept behind SAVE_CSV (and is the fallback without pyarrow).
+    """
     logger.info("=" * 50)
     logger.info("SAVING CLEANED DATA")
     logger.info("=" * 50)
     
-    df.to_csv(output_path, index=False)
+    output_paths = []
+    
+    if HAS_PYARROW:
+        parquet_path = PROCESSED_DATA_DIR / parquet_filename
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, parquet_path, compression='zstd')
+        output_paths.append(parquet_path)
+    
+    if SAVE_CSV or not output_paths:
+        csv_path = PROCESSED_DATA_DIR / filename
+        df.to_csv(csv_path, index=False)
+        output_paths.append(csv_path)
     
-    logger.info(f"  Output: {output_path}")
     logger.info(f"  Size: {len(df):,} rows × {len(df.columns)} columns")
     
-    if output_path.exists():
-        file_size = output_path.stat().st_size / 1024
-        logger.info(f"  File size: {file_size:.1f} KB ✓")
+    for output_path in output_paths:
+        logger.info(f"  Output: {output_path}")
+        if output_path.exists():
+            file_size = output_path.stat().st_size / 1024
+            logger.info(f"  File size: {file_size:.1f} KB ✓")
     
-    return output_path
+    return output_paths[0]
 
 
 # ============================================================================
@@ -366,12 +653,16 @@ def main():
         df = load_raw_data()
         logger.info("\n")
         
+        # Numeric columns are resolved from the dtypes once and passed through
+        numeric_cols = df.columns[df.dtypes.map(pd.api.types.is_numeric_dtype)]
+        
         # Step 2: Clean missing values
-        df = clean_missing_values(df)
+        df = clean_missing_values(df, numeric_cols=numeric_cols)
+        numeric_cols = numeric_cols.intersection(df.columns)  # minus dropped columns
         logger.info("\n")
         
         # Step 3: Handle outliers
-        df = handle_outliers_zscore(df)
+        df = handle_outliers_zscore(df, numeric_cols=numeric_cols)
         logger.info("\n")
         
         # Step 4: Remove duplicates
@@ -10,12 +10,14 @@ Data Source: REIT_sample_2000_2024_All_Variables.csv
 Sample includes REITs from 2000-2024 with financial metrics and returns
 
 Pipeline steps:
-  1. Load raw REIT data
-  2. Clean missing values (drop/impute with justification)
+  1. Load raw REIT data (the 17 REQUIRED_COLS; permno, ptype, psub, caldt
+     and ym are not read)
+  2. Clean missing values (impute; >50%-missing columns are only dropped
+     with strict=True)
   3. Handle outliers (winsorize/cap)
   4. Remove duplicates
   5. Apply REIT-specific filters (asset size, data quality)
-  6. Save cleaned data to data/processed/
+  6. Save cleaned data to data/processed/ (18 columns: REQUIRED_COLS + year)
 
 Author: [Ashley]
 Date: [2/19/2026]
@@ -28,8 +30,29 @@ Last Modified: [2/19/2026]
 
 import pandas as pd
 import numpy as np
+import os
 from pathlib import Path
-from scipy import stats
+
+# Optional: Polars for the vectorized outlier pass (USE_POLARS=1; falls back to pandas/NumPy)
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+# Optional: joblib threads for the per-column winsorize on the pandas path
+try:
+    from joblib import Parallel, delayed
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
+# Optional: PyArrow's multithreaded CSV parser for load_raw_data
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # Import centralized path configuration
 from config_paths import RAW_DATA_DIR, PROCESSED_DATA_DIR
@@ -40,7 +63,9 @@ from config_paths import RAW_DATA_DIR, PROCESSED_DATA_DIR
 
 # Input/Output file names
 RAW_FILENAME = "REIT_sample_2000_2024_All_Variables.csv"  # Raw REIT data
-PROCESSED_FILENAME = "REIT_sample_clean.csv"  # Output file for data/processed/
+PROCESSED_FILENAME = "REIT_sample_clean.parquet"  # Output file for data/processed/
+OUTPUT_FORMAT = "parquet"  # "parquet" (zstd, needs pyarrow) or "csv"
+CATEGORICAL_COLUMNS = ['ticker']  # Dictionary-encoded in the Parquet output (string labels only)
 
 # Data cleaning parameters
 MISSING_VALUE_THRESHOLD = 0.5  # Drop columns with >50% missing values
@@ -53,19 +78,67 @@ MIN_ASSETS = 100  # Minimum assets in millions (to filter very small REITs)
 START_YEAR = 2000  # Analysis period starts
 END_YEAR = 2024  # Analysis period ends
 
+# Raw file reading
+REIT_DTYPES = {  # Applied by the reader, so no float64 columns are ever allocated
+    'permno': 'int32',
+    'ticker': 'str',
+    'comnam': 'str',
+    'rtype': 'float32',  # Parsed as a number, then stored as category after load
+    'ptype': 'float32',
+    'psub': 'float32',
+    'date': 'str',  # ISO dates kept as text; apply_filters slices the year
+    'caldt': 'str',
+    'ym': 'str',
+    'usdret': 'float32',
+    'usdprc': 'float32',
+    'market_equity': 'float32',
+    'assets': 'float32',
+    'sales': 'float32',
+    'net_income': 'float32',
+    'book_equity': 'float32',
+    'debt_at': 'float32',
+    'cash_at': 'float32',
+    'ocf_at': 'float32',
+    'roe': 'float32',
+    'btm': 'float32',
+    'beta': 'float32',
+}
+REQUIRED_COLS = [  # Columns the filters and create_analysis_panel.py actually use
+    'ticker', 'comnam', 'rtype', 'date',
+    'usdret', 'usdprc', 'market_equity', 'assets', 'sales', 'net_income',
+    'book_equity', 'debt_at', 'cash_at', 'ocf_at', 'roe', 'btm', 'beta',
+]
+STREAM_RAW = os.getenv('STREAM_RAW') == '1'  # Opt-in chunked read for very large raw files
+USE_POLARS = os.getenv('USE_POLARS') == '1'  # Opt-in Polars backend for the outlier pass
+STREAM_CHUNKSIZE = 500_000  # Rows parsed per chunk when streaming
+
+if USE_POLARS and not HAS_POLARS:
+    print("USE_POLARS=1 but polars is not installed; using pandas")
+
 # ============================================================================
 # Section 3: Load Raw Data
 # ============================================================================
 
-def load_raw_data(filename=RAW_FILENAME):
+def load_raw_data(filename=RAW_FILENAME, chunksize=STREAM_CHUNKSIZE if STREAM_RAW else None,
+                  usecols=REQUIRED_COLS):
     """
     Load raw CSV data from data/raw/ directory.
     
+    With a chunksize (STREAM_RAW=1) the file is read in chunks and each
+    chunk is pre-filtered with the REIT filters before concatenation, so
+    peak memory is about one chunk plus the kept rows. Rows with missing
+    assets, usdret or usdprc fail those filters and are dropped before
+    imputation (the default run imputes them first), so medians/outlier
+    bounds are computed on the filtered sample and fewer rows are kept.
+    
     Args:
         filename (str): Name of the raw CSV file
+        chunksize (int): Rows per chunk; None reads the whole file at once
+        usecols (list): Columns to read; None reads every column in REIT_DTYPES
         
     Returns:
         pd.DataFrame: Raw dataframe
+        dict: Rows read from the file and rows removed by the chunk prefilter
         
     Raises:
         FileNotFoundError: If raw data file doesn't exist
@@ -76,25 +149,76 @@ def load_raw_data(filename=RAW_FILENAME):
         raise FileNotFoundError(f"Raw data not found at: {raw_path}")
     
     print(f"Loading raw data from: {raw_path}")
-    df = pd.read_csv(raw_path)
+    # Explicit dtypes skip per-column inference (and per-chunk re-inference);
+    # usecols projects to REQUIRED_COLS, so every later pass scans fewer columns
+    usecols = list(REIT_DTYPES) if usecols is None else usecols
+    read_kwargs = {'usecols': usecols, 'dtype': {col: REIT_DTYPES[col] for col in usecols}}
+    if chunksize:
+        rows_read = 0
+        chunks = []
+        for chunk in pd.read_csv(raw_path, chunksize=chunksize, **read_kwargs):
+            rows_read += len(chunk)
+            chunks.append(prefilter_chunk(chunk))
+        df = pd.concat(chunks, ignore_index=True)
+        print(f"  Read in chunks of {chunksize:,} rows (REIT filters applied per chunk)")
+    elif HAS_PYARROW:
+        df = pd.read_csv(raw_path, engine='pyarrow', **read_kwargs)
+    else:
+        df = pd.read_csv(raw_path, **read_kwargs)
+    if not chunksize:
+        rows_read = len(df)
+    summary = {"rows_read": rows_read, "rows_prefiltered": rows_read - len(df)}
+    
+    # REIT type codes as category: 1 byte per row, and the rtype filter compares
+    # integer codes. Cast after parsing so the categories are numbers (2.0), not '2.0'
+    df['rtype'] = df['rtype'].astype('category')
     
     print(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
     print(f"  Columns: {list(df.columns)}")
     
-    return df
+    return df, summary
+
+
+def prefilter_chunk(chunk):
+    """
+    Apply the apply_filters row conditions to one raw chunk.
+    
+    Args:
+        chunk (pd.DataFrame): Chunk of the raw CSV
+        
+    Returns:
+        pd.DataFrame: Rows passing the year, assets, returns, price and rtype
+            filters (rows missing assets, usdret or usdprc are dropped)
+    """
+    keep = pd.Series(True, index=chunk.index)
+    if 'date' in chunk.columns:
+        keep &= extract_year(chunk['date']).between(START_YEAR, END_YEAR).fillna(False)
+    if 'assets' in chunk.columns:
+        keep &= chunk['assets'] >= MIN_ASSETS
+    if 'usdret' in chunk.columns:
+        keep &= chunk['usdret'].notna()
+    if 'usdprc' in chunk.columns:
+        keep &= chunk['usdprc'] > 0
+    if 'rtype' in chunk.columns:
+        keep &= chunk['rtype'] == 2.0
+    return chunk[keep]
 
 
 # ============================================================================
 # Section 4: Clean Missing Values
 # ============================================================================
 
-def clean_missing_values(df, threshold=MISSING_VALUE_THRESHOLD):
+def clean_missing_values(df, threshold=MISSING_VALUE_THRESHOLD, numeric_cols=None, strict=False):
     """
-    Handle missing values by dropping columns exceeding threshold
-    and imputing remaining missing values.
+    Handle missing values by imputing them; with strict=True, columns
+    exceeding threshold are dropped first.
+    
+    By default no column is dropped: heavy-gap columns are imputed like
+    any other, since the run only loads REQUIRED_COLS, which the filters
+    and the analysis panel need.
     
     Justification for strategy:
-      - Columns with >50% missing are likely unreliable → DROP
+      - Columns with >50% missing are likely unreliable → DROP (strict=True)
       - Numeric columns: impute with median (robust to outliers)
       - Categorical columns: impute with mode (most frequent)
       - Small amounts of missing are common in real data
@@ -102,6 +226,8 @@ def clean_missing_values(df, threshold=MISSING_VALUE_THRESHOLD):
     Args:
         df (pd.DataFrame): Input dataframe
         threshold (float): Proportion threshold for dropping columns (0-1)
+        numeric_cols (list): Numeric columns from main(); resolved from df when omitted
+        strict (bool): Drop columns above threshold (exploratory runs on all raw columns)
         
     Returns:
         pd.DataFrame: Dataframe with missing values handled
@@ -109,34 +235,40 @@ def clean_missing_values(df, threshold=MISSING_VALUE_THRESHOLD):
     """
     summary = {"rows_before": len(df), "cols_before": len(df.columns)}
     
-    # Step 1: Calculate missing value percentages
-    missing_pct = df.isnull().sum() / len(df)
+    # Step 1: Calculate missing value percentages (one isnull pass, reused below)
+    null_counts = df.isnull().sum()
+    missing_pct = null_counts / len(df)
     print(f"\nMissing Values Summary:")
     print(f"  Columns with >5% missing: {missing_pct[missing_pct > 0.05].to_dict()}")
     
-    # Step 2: Drop columns with excessive missing values
-    cols_to_drop = missing_pct[missing_pct > threshold].index
+    # Step 2: Drop columns with excessive missing values (strict runs only)
+    cols_to_drop = missing_pct[missing_pct > threshold].index if strict else pd.Index([])
     if len(cols_to_drop) > 0:
         print(f"  Dropping {len(cols_to_drop)} columns exceeding {threshold*100}% threshold")
         print(f"    Columns dropped: {list(cols_to_drop)}")
         df = df.drop(columns=cols_to_drop)
+        null_counts = null_counts.drop(cols_to_drop)
     
-    # Step 3: Impute remaining missing values
-    for col in df.columns:
-        if df[col].isnull().sum() > 0:
-            if df[col].dtype in ['float64', 'int64']:
-                # Numeric: impute with median
-                impute_val = df[col].median()
-                impute_method = "median"
-            else:
-                # Categorical: impute with mode
-                mode_result = df[col].mode()
-                impute_val = mode_result[0] if len(mode_result) > 0 else "Unknown"
-                impute_method = "mode"
-            
-            missing_count = df[col].isnull().sum()
-            df[col] = df[col].fillna(impute_val)
-            print(f"  Imputed {missing_count} values in '{col}' with {impute_method}: {impute_val}")
+    # Step 3: Impute remaining missing values in a single fillna
+    cols_needing_fill = null_counts[null_counts > 0].index
+    if numeric_cols is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+    numeric_fill = pd.Index(numeric_cols).intersection(cols_needing_fill)
+    
+    # Numeric: impute with median
+    fill_map = dict(zip(numeric_fill, df[numeric_fill].median().to_numpy()))
+    impute_methods = dict.fromkeys(numeric_fill, "median")
+    
+    # Categorical: impute with mode
+    for col in cols_needing_fill.difference(numeric_fill, sort=False):
+        mode_result = df[col].mode()
+        fill_map[col] = mode_result.iat[0] if len(mode_result) > 0 else "Unknown"
+        impute_methods[col] = "mode"
+    
+    df = df.fillna(fill_map)
+    # str() of the float32 medians prints 0.0092 rather than its float64 widening
+    for col in cols_needing_fill:
+        print(f"  Imputed {null_counts[col]} values in '{col}' with {impute_methods[col]}: {fill_map[col]!s}")
     
     summary["rows_after"] = len(df)
     summary["cols_after"] = len(df.columns)
@@ -149,24 +281,27 @@ def clean_missing_values(df, threshold=MISSING_VALUE_THRESHOLD):
 # Section 5: Handle Outliers
 # ============================================================================
 
-def identify_outliers_iqr(series, k=OUTLIER_THRESHOLD):
+def identify_outliers_iqr(data, k=OUTLIER_THRESHOLD):
     """
     Identify outliers using Interquartile Range (IQR) method.
     Outliers = values outside Q1 - k*IQR and Q3 + k*IQR
     
     Args:
-        series (pd.Series): Numeric series
+        data (pd.Series or pd.DataFrame): Numeric series, or a block of
+            numeric columns (quartiles are taken per column)
         k (float): IQR multiplier (1.5 is standard)
         
     Returns:
-        pd.Series: Boolean series indicating outliers
+        pd.Series or pd.DataFrame: Boolean mask indicating outliers
     """
-    Q1 = series.quantile(0.25)
-    Q3 = series.quantile(0.75)
+    # One partition for both quartiles instead of two .quantile() sorts
+    values = data.to_numpy(dtype=np.float64)
+    Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
     IQR = Q3 - Q1
-    lower_bound = Q1 - k * IQR
-    upper_bound = Q3 + k * IQR
-    return (series < lower_bound) | (series > upper_bound)
+    mask = (values < Q1 - k * IQR) | (values > Q3 + k * IQR)
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(mask, index=data.index, columns=data.columns)
+    return pd.Series(mask, index=data.index)
 
 
 def identify_outliers_zscore(series, threshold=OUTLIER_THRESHOLD):
@@ -181,11 +316,12 @@ def identify_outliers_zscore(series, threshold=OUTLIER_THRESHOLD):
     Returns:
         pd.Series: Boolean series indicating outliers
     """
-    z_scores = np.abs(stats.zscore(series.dropna()))
-    return np.abs(stats.zscore(series)) > threshold
+    values = series.to_numpy(dtype=np.float64)
+    z_scores = np.abs((values - np.nanmean(values)) / np.nanstd(values))
+    return pd.Series(z_scores > threshold, index=series.index)
 
 
-def handle_outliers(df, method=OUTLIER_METHOD, numeric_only=True):
+def handle_outliers(df, method=OUTLIER_METHOD, numeric_only=True, numeric_cols=None):
     """
     Handle outliers in numeric columns using specified method.
     Default: cap outliers using Winsorization (preserve data while reducing extremes)
@@ -196,10 +332,13 @@ def handle_outliers(df, method=OUTLIER_METHOD, numeric_only=True):
       - Better than deletion for small datasets
       - More robust than mean/median imputation
     
+    With USE_POLARS=1 the same pass runs as one lazy Polars plan.
+    
     Args:
         df (pd.DataFrame): Input dataframe
         method (str): "iqr" or "zscore"
         numeric_only (bool): Only process numeric columns
+        numeric_cols (list): Numeric columns from main(); resolved from df when omitted
         
     Returns:
         pd.DataFrame: Dataframe with outliers handled
@@ -209,28 +348,104 @@ def handle_outliers(df, method=OUTLIER_METHOD, numeric_only=True):
     
     print(f"\nHandling Outliers ({method.upper()} method):")
     
-    if numeric_only:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if numeric_cols is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns if numeric_only else df.columns
+    
+    if USE_POLARS and HAS_POLARS:
+        return handle_outliers_polars(df, numeric_cols, method=method)
+    
+    # Identify outliers
+    if method == "iqr":
+        # Quartiles for every column in one call; bounds broadcast over the block
+        outlier_counts = identify_outliers_iqr(df[numeric_cols], k=OUTLIER_THRESHOLD).sum().to_numpy()
+    elif method == "zscore":
+        outlier_counts = [identify_outliers_zscore(df[col], threshold=OUTLIER_THRESHOLD).sum()
+                          for col in numeric_cols]
+    else:
+        raise ValueError(f"Unknown outlier method: {method}")
+    
+    # Cap outliers using Winsorization. Columns are independent and NumPy's
+    # percentile/clip release the GIL, so they run on a thread pool if available
+    outliers = {col: outlier_count for col, outlier_count in zip(numeric_cols, outlier_counts) if outlier_count > 0}
+    if HAS_JOBLIB and len(outliers) > 1:
+        clipped = Parallel(n_jobs=-1, prefer='threads')(
+            delayed(winsorize_column)(df[col].to_numpy()) for col in outliers
+        )
     else:
-        numeric_cols = df.columns
+        clipped = [winsorize_column(df[col].to_numpy()) for col in outliers]
+    
+    for (col, outlier_count), values in zip(outliers.items(), clipped):
+        summary["outliers_found"] += outlier_count
+        summary["columns_processed"] += 1
+        df[col] = values
+        print(f"  '{col}': {outlier_count} outliers → winsorized")
+    
+    return df, summary
+
+
+def winsorize_column(values):
+    """
+    Clip one column at the WINSORIZE_LIMITS percentiles (a partition,
+    not a full sort). The result is cast back so int columns keep their dtype.
+    
+    Args:
+        values (np.ndarray): Column values
+        
+    Returns:
+        np.ndarray: Winsorized values
+    """
+    lower, upper = np.nanpercentile(values, [WINSORIZE_LIMITS[0] * 100, 100 - WINSORIZE_LIMITS[1] * 100])
+    return np.clip(values, lower, upper).astype(values.dtype, copy=False)
+
+
+def handle_outliers_polars(df, numeric_cols, method=OUTLIER_METHOD):
+    """
+    Polars version of handle_outliers. Outlier counts and winsorized values
+    for every numeric column are built as one lazy plan, so each column is
+    scanned once and the columns are processed in parallel.
+    
+    Winsorization clips at the linear WINSORIZE_LIMITS percentiles
+    (5th/95th), the same bounds as the NumPy fallback.
+    
+    Args:
+        df (pd.DataFrame): Input dataframe
+        numeric_cols (list): Columns to check and winsorize
+        method (str): "iqr" or "zscore"
+        
+    Returns:
+        pd.DataFrame: Dataframe with outliers handled
+        dict: Summary of outliers found
+    """
+    summary = {"outliers_found": 0, "columns_processed": 0}
     
+    lower_q, upper_q = WINSORIZE_LIMITS[0], 1 - WINSORIZE_LIMITS[1]
+    count_exprs, clip_exprs = [], []
     for col in numeric_cols:
-        # Identify outliers
+        c = pl.col(col)
         if method == "iqr":
-            outlier_mask = identify_outliers_iqr(df[col], k=OUTLIER_THRESHOLD)
+            q1 = c.quantile(0.25, "linear")
+            q3 = c.quantile(0.75, "linear")
+            iqr = q3 - q1
+            is_outlier = (c < q1 - OUTLIER_THRESHOLD * iqr) | (c > q3 + OUTLIER_THRESHOLD * iqr)
         elif method == "zscore":
-            outlier_mask = identify_outliers_zscore(df[col], threshold=OUTLIER_THRESHOLD)
+            # Constant columns give 0/0 = NaN, which Polars orders above every number
+            is_outlier = ((c - c.mean()) / c.std(ddof=0)).abs().fill_nan(0.0) > OUTLIER_THRESHOLD
         else:
             raise ValueError(f"Unknown outlier method: {method}")
-        
-        outlier_count = outlier_mask.sum()
+        count_exprs.append(is_outlier.sum().alias(col))
+        clip_exprs.append(c.clip(c.quantile(lower_q, "linear"), c.quantile(upper_q, "linear")).alias(col))
+    
+    lf = pl.from_pandas(df[list(numeric_cols)]).lazy()
+    counts, clipped = pl.collect_all([lf.select(count_exprs), lf.select(clip_exprs)])
+    
+    for col in numeric_cols:
+        outlier_count = counts[col].item()
         if outlier_count > 0:
             summary["outliers_found"] += outlier_count
             summary["columns_processed"] += 1
             
-            # Cap outliers using Winsorization
-            limits = WINSORIZE_LIMITS
-            df[col] = stats.mstats.winsorize(df[col], limits=limits)
+            # Write back as numpy so integer columns keep their dtype
+            df[col] = clipped[col].to_numpy()
             
             print(f"  '{col}': {outlier_count} outliers → winsorized")
     
@@ -257,16 +472,18 @@ def remove_duplicates(df):
         pd.DataFrame: Deduplicated dataframe
         dict: Summary of duplicates removed
     """
+    # One hash pass: the same mask gives the count and the rows to drop
+    duplicate_mask = df.duplicated(keep='first')
     summary = {
         "rows_before": len(df),
-        "duplicates_found": df.duplicated().sum(),
+        "duplicates_found": int(duplicate_mask.sum()),
         "rows_after": 0
     }
     
     if summary["duplicates_found"] > 0:
         print(f"\nRemoving Duplicates:")
         print(f"  Found {summary['duplicates_found']} duplicate rows")
-        df = df.drop_duplicates(keep='first')
+        df = df.loc[~duplicate_mask]
         print(f"  ✓ Duplicates removed")
     
     summary["rows_after"] = len(df)
@@ -303,46 +520,50 @@ def apply_filters(df):
     
     print(f"\nApplying REIT-Specific Filters:")
     
+    keep = np.ones(len(df), dtype=bool)
+    
     # FILTER 1: Date/Year range
     if 'date' in df.columns:
-        df['year'] = pd.to_datetime(df['date']).dt.year
-        df = df[(df['year'] >= START_YEAR) & (df['year'] <= END_YEAR)]
+        df['year'] = extract_year(df['date'])
+        keep &= df['year'].between(START_YEAR, END_YEAR).to_numpy(dtype=bool, na_value=False)
         summary["filters_applied"].append(f"year_filter_{START_YEAR}_{END_YEAR}")
         print(f"  Filter 1: Year range {START_YEAR}-{END_YEAR}")
     
     # FILTER 2: Minimum assets threshold
     if 'assets' in df.columns:
-        valid_assets = df['assets'].notna().sum()
-        df = df[df['assets'] >= MIN_ASSETS]
-        assets_removed = valid_assets - df['assets'].notna().sum()
+        assets_before = keep.sum()
+        keep &= (df['assets'] >= MIN_ASSETS).to_numpy()
+        assets_removed = assets_before - keep.sum()
         summary["filters_applied"].append(f"min_assets_{MIN_ASSETS}M")
         print(f"  Filter 2: Assets >= ${MIN_ASSETS}M (removed {assets_removed} rows)")
     
     # FILTER 3: Valid returns (non-null and non-zero)
     if 'usdret' in df.columns:
-        returns_before = df['usdret'].notna().sum()
-        df = df[df['usdret'].notna()]
+        returns_before = keep.sum()
+        keep &= df['usdret'].notna().to_numpy()
         summary["filters_applied"].append("valid_returns")
-        returns_removed = returns_before - df['usdret'].notna().sum()
+        returns_removed = returns_before - keep.sum()
         print(f"  Filter 3: Valid returns data (removed {returns_removed} rows)")
     
-    # FILTER 4: Valid prices
+    # FILTER 4: Valid prices (NaN compares False, so > 0 also drops nulls)
     if 'usdprc' in df.columns:
-        price_before = df['usdprc'].notna().sum()
-        df = df[(df['usdprc'].notna()) & (df['usdprc'] > 0)]
+        price_before = keep.sum()
+        keep &= (df['usdprc'] > 0).to_numpy()
         summary["filters_applied"].append("valid_prices")
-        price_removed = price_before - df['usdprc'].notna().sum()
+        price_removed = price_before - keep.sum()
         print(f"  Filter 4: Valid prices (removed {price_removed} rows)")
     
     # FILTER 5: REIT type (if rtype column exists)
     if 'rtype' in df.columns:
         # Keep rtype = 2.0 (common REIT type code)
-        rtype_before = len(df)
-        df = df[df['rtype'] == 2.0]
+        rtype_before = keep.sum()
+        keep &= (df['rtype'] == 2.0).to_numpy()
         summary["filters_applied"].append("rtype_2.0")
-        rtype_removed = rtype_before - len(df)
+        rtype_removed = rtype_before - keep.sum()
         print(f"  Filter 5: REIT type = 2.0 (removed {rtype_removed} rows)")
     
+    df = df.loc[keep]
+    
     summary["rows_after"] = len(df)
     rows_removed = summary["rows_before"] - summary["rows_after"]
     
@@ -353,27 +574,62 @@ def apply_filters(df):
     return df, summary
 
 
+def extract_year(dates):
+    """
+    Year of each date. ISO YYYY-MM-DD strings are sliced rather than
+    parsed, which skips full datetime parsing; other dtypes go through
+    pd.to_datetime.
+    
+    Args:
+        dates (pd.Series): Date column
+        
+    Returns:
+        pd.Series: Years (nullable Int16 for strings); missing or malformed
+            dates give <NA>/NaN, which fall outside any between() range
+    """
+    if pd.api.types.is_string_dtype(dates):
+        return pd.to_numeric(dates.str[:4], errors='coerce').astype('Int16')
+    return pd.to_datetime(dates).dt.year
+
+
 # ============================================================================
 # Section 8: Save Cleaned Data
 # ============================================================================
 
-def save_cleaned_data(df, filename=PROCESSED_FILENAME):
+def save_cleaned_data(df, filename=PROCESSED_FILENAME, file_format=OUTPUT_FORMAT):
     """
     Save cleaned dataframe to data/processed/ directory.
     
+    Parquet output is zstd-compressed with ticker stored as category
+    (dictionary-encoded). rtype is written as a plain float column:
+    Parquet readers only restore dictionaries for string columns.
+    Falls back to CSV when pyarrow is not installed; the file suffix
+    follows the format actually written.
+    
     Args:
         df (pd.DataFrame): Cleaned dataframe
         filename (str): Output filename
+        file_format (str): "parquet" or "csv"
         
     Returns:
         Path: Path to saved file
     """
-    output_path = PROCESSED_DATA_DIR / filename
+    if file_format == "parquet" and not HAS_PYARROW:
+        print("\n  pyarrow not installed; saving as CSV instead of Parquet")
+        file_format = "csv"
+    
+    output_path = (PROCESSED_DATA_DIR / filename).with_suffix(f".{file_format}")
     
     print(f"\nSaving cleaned data:")
     print(f"  Output file: {output_path}")
     
-    df.to_csv(output_path, index=False)
+    if file_format == "parquet":
+        categorical = {col: 'category' for col in CATEGORICAL_COLUMNS if col in df.columns}
+        df.astype(categorical).to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    elif file_format == "csv":
+        df.to_csv(output_path, index=False)
+    else:
+        raise ValueError(f"Unknown output format: {file_format}")
     
     print(f"  ✓ Saved {len(df)} rows × {len(df.columns)} columns")
     
@@ -398,13 +654,17 @@ def main():
     print("=" * 70)
     
     # Load raw data
-    df = load_raw_data()
+    df, load_summary = load_raw_data()
+    
+    # Numeric columns are resolved once and passed to the cleaning steps
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
     
     # Clean missing values
-    df, missing_summary = clean_missing_values(df)
+    df, missing_summary = clean_missing_values(df, numeric_cols=numeric_cols)
+    numeric_cols = numeric_cols.intersection(df.columns, sort=False)  # minus dropped columns
     
     # Handle outliers
-    df, outlier_summary = handle_outliers(df)
+    df, outlier_summary = handle_outliers(df, numeric_cols=numeric_cols)
     
     # Remove duplicates
     df, duplicate_summary = remove_duplicates(df)
@@ -419,13 +679,15 @@ def main():
     print("\n" + "=" * 70)
     print("Pipeline Complete - REIT Sample Summary")
     print("=" * 70)
-    print(f"Initial rows: {missing_summary['rows_before']:,}")
-    print(f"Final rows: {len(df):,} ({(len(df)/missing_summary['rows_before']*100):.1f}% retained)")
+    print(f"Initial rows: {load_summary['rows_read']:,}")
+    print(f"Final rows: {len(df):,} ({(len(df)/load_summary['rows_read']*100):.1f}% retained)")
     print(f"Final columns: {len(df.columns)}")
     print(f"\nData Quality Metrics:")
     print(f"  - Columns dropped: {missing_summary['cols_before'] - missing_summary['cols_after']}")
     print(f"  - Outliers handled: {outlier_summary['outliers_found']}")
     print(f"  - Duplicates removed: {duplicate_summary['duplicates_found']}")
+    if load_summary['rows_prefiltered']:
+        print(f"  - Rows removed by streaming prefilter: {load_summary['rows_prefiltered']}")
     print(f"  - Rows removed by REIT filters: {filter_summary['rows_before'] - filter_summary['rows_after']}")
     print(f"\nOutputting to: {output_path}")
     print("=" * 70)